@@ -3,23 +3,74 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import os
-from typing import Any
+from typing import Any, List, Optional
 
 try:
-    from openai import AsyncOpenAI
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 except ImportError:
     AsyncOpenAI = None  # type: ignore
+    DefaultAsyncHttpxClient = None  # type: ignore
+
+# One pooled transport for the whole process, shared by every client instance
+_http_client: Any = None
+
+
+def _get_http_client() -> Any:
+    """Return the process-wide pooled HTTP client, creating it on first use.
+
+    Built from the SDK's DefaultAsyncHttpxClient so its timeout, pool limits and
+    redirect settings still apply. HTTP/2 lets concurrent NPC requests share one
+    connection; it needs the h2 package (httpx[http2]), so fall back to HTTP/1.1
+    without it.
+    """
+    global _http_client
+    if _http_client is None:
+        try:
+            _http_client = DefaultAsyncHttpxClient(http2=True)
+        except ImportError:
+            _http_client = DefaultAsyncHttpxClient()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created (called on server shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        client, _http_client = _http_client, None
+        await client.aclose()
 
 
 class LLMClient(abc.ABC):
     """Abstract base class for LLM clients."""
 
     @abc.abstractmethod
-    async def complete(self, prompt: str, **params: Any) -> str:
+    async def complete(self, prompt: str, system: Optional[str] = None, **params: Any) -> str:
         """Generate a completion for the given prompt."""
         pass
 
+    async def batch_complete(
+        self,
+        prompts: List[str],
+        systems: Optional[List[Optional[str]]] = None,
+        return_exceptions: bool = False,
+        **params: Any,
+    ) -> List[Any]:
+        """Generate completions for several prompts, results in prompt order.
+
+        ``systems`` optionally pairs each prompt with its system message. With
+        ``return_exceptions`` a failed request yields its exception in place of
+        the text instead of failing the whole batch. The default issues the
+        requests concurrently; backends with a native batch API can override
+        this to submit them in a single request.
+        """
+        systems = systems or [None] * len(prompts)
+        return list(await asyncio.gather(
+            *(self.complete(p, system=s, **params) for p, s in zip(prompts, systems)),
+            return_exceptions=return_exceptions,
+        ))
+
 
 class OpenRouterClient(LLMClient):
     """Unified OpenRouter client, supporting all models."""
@@ -36,16 +87,31 @@ class OpenRouterClient(LLMClient):
         self.client = AsyncOpenAI(
             api_key=api_key,
             base_url=base_url,
+            http_client=_get_http_client(),
         )
         self.model_name = model_name
         print(f"[LLM] OpenRouter initialized: model={model_name}")
 
-    async def complete(self, prompt: str, **params: Any) -> str:
+    def _system_content(self, system: str) -> Any:
+        """Mark the system message as a cache breakpoint where the provider needs one.
+
+        Only Anthropic models take explicit cache_control breakpoints; OpenAI-style
+        providers cache identical prefixes automatically, so the plain string is kept.
+        """
+        if not self.model_name.startswith("anthropic/"):
+            return system
+        return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
+    async def complete(self, prompt: str, system: Optional[str] = None, **params: Any) -> str:
         print(f"[LLM] Calling API: model={self.model_name}")
         try:
+            messages = []
+            if system:
+                messages.append({"role": "system", "content": self._system_content(system)})
+            messages.append({"role": "user", "content": prompt})
             response = await self.client.chat.completions.create(
                 model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 temperature=params.get("temperature", 0.7),
                 max_tokens=params.get("max_tokens", 512),
             )
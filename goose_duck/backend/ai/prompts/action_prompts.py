@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from ...models.identity import RoleType
 
@@ -12,8 +12,14 @@ def build_decision_prompt(
     obs: Dict[str, Any],
     role_hint: str = "",
     win_text: str = "",
-) -> str:
-    """Build the decision prompt text for an NPC."""
+    memory_text: str = "",
+    tasks_text: str = "",
+    static_prefix: str = "",
+) -> Tuple[str, str]:
+    """Build the (system, user) decision prompt for an NPC.
+
+    The system part only depends on the role, so NPCs sharing a role share it verbatim.
+    """
     role = obs.get("role")
     role_info = ""
     team_goals = {
@@ -22,19 +28,19 @@ def build_decision_prompt(
         "neutral": "Act according to your special win condition.",
     }
     if role:
-        role_info = f"{role.name} (Team: {role.team.value}), Abilities: {', '.join(role.abilities) if role.abilities else 'None'}"
-    team_goal = team_goals.get(role.team.value, "") if role else ""
+        role_info = f"{role.name} (Team: {role.team}), Abilities: {', '.join(role.abilities) if role.abilities else 'None'}"
+    team_goal = team_goals.get(role.team, "") if role else ""
     win_condition = win_text or (role.win_condition if role and role.win_condition else "")
     if role and not win_condition:
         # fallback by team
-        if role.team.value == "good":
+        if role.team == "good":
             win_condition = "Complete all tasks, or eliminate all evil players."
-        elif role.team.value == "evil":
+        elif role.team == "evil":
             win_condition = "Evil player count reaches or exceeds good player count."
         else:
             win_condition = "Meet your neutral win condition."
 
-    mem_text = "\n".join(obs.get("memories", [])) if obs.get("memories") else "(No recent memories)"
+    mem_text = memory_text or "(No recent memories)"
     people_text = ", ".join(
         f"{p['name']}{'❌' if not p['is_alive'] else ''}" for p in obs.get("people_here", [])
     ) or "No one"
@@ -42,27 +48,33 @@ def build_decision_prompt(
         f"- {a['type']} -> {a.get('target') or ''} ({a.get('label','')})"
         for a in obs.get("available_actions", [])
     ) or "No available actions"
-    tasks_info = obs.get("tasks_info", [])
-    tasks_text = "\n".join(
-        f"- {t['name']} @ {t.get('room_name') or t.get('room_id') or 'Unknown'} : {t.get('progress', 0)}/2"
-        for t in tasks_info
-    ) or "No task information"
+    tasks_text = tasks_text or "No task information"
 
-    return f"""
-You are {npc_name}. You are playing a Goose Duck game.
+    system = static_prefix + f"""
 [Game Objectives]
 - Good players complete tasks and eliminate evil players; Evil players disguise and eliminate good players; Neutral players win by their own conditions.
 - Your team goal: {team_goal}
 - Your identity: {role_info}
 - Role hint: {role_hint}
+- Your abilities: {', '.join(role.abilities) if role and role.abilities else 'None'}
+- Your win condition: {win_condition}
+
+[Note]
+If you are a good player, prioritize completing tasks first. Do not call an emergency meeting before you can confirm identities.
+
+[Goal]
+Make your next action based on your team and identity. Choose the most reasonable action.
+Respond only in JSON format, no other content:
+{{"action": "move|kill|report|emergency|vote|wait", "target": "room_id or player_id or null", "reason": "brief reason"}}
+"""
+    user = f"""
+You are {npc_name}. You are playing a Goose Duck game.
 [Current Information]
 - Phase: {obs.get('phase')}  Round: {obs.get('round')}
 - Current location: {obs.get('room').name if obs.get('room') else 'Unknown'}
 - Room description: {obs.get('room').description if obs.get('room') else ''}
 - Reachable rooms: {', '.join(obs.get('connections', [])) or 'None'}
 - People here: {people_text}
-- Your abilities: {', '.join(role.abilities) if role and role.abilities else 'None'}
-- Your win condition: {win_condition}
 - Available actions:
 {actions_text}
 - Task progress:
@@ -70,12 +82,5 @@ You are {npc_name}. You are playing a Goose Duck game.
 
 [Your Memories]
 {mem_text}
-
-[Note]
-If you are a good player, prioritize completing tasks first. Do not call an emergency meeting before you can confirm identities.
-
-[Goal]
-Make your next action based on your team and identity. Choose the most reasonable action.
-Respond only in JSON format, no other content:
-{{"action": "move|kill|report|emergency|vote|wait", "target": "room_id or player_id or null", "reason": "brief reason"}}
 """
+    return system, user
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Tuple
 
 
 def build_chat_prompt(
@@ -13,21 +13,33 @@ def build_chat_prompt(
     role_hint: str,
     abilities_text: str,
     win_text: str,
-    memories: List[str],
+    memory_text: str,
     chat_history: List[str],
-    tasks_info: List[str],
-) -> str:
-    mem_text = "\n".join(memories) if memories else "(No recent memories)"
+    tasks_text: str,
+    static_prefix: str = "",
+) -> Tuple[str, str]:
+    """Construct the (system, user) prompt for an NPC conversation reply.
+
+    memory_text and tasks_text arrive pre-joined so callers can reuse them across replies.
+    """
+    mem_text = memory_text or "(No recent memories)"
     history_text = "\n".join(f"- {h}" for h in chat_history) if chat_history else "(No conversation history)"
-    tasks_text = "\n".join(f"- {t}" for t in tasks_info) if tasks_info else "(No task information)"
-    return f"""
-You are {npc_name}, currently conversing with {partner_name} in a Goose Duck game.
+    tasks_text = tasks_text or "(No task information)"
+    system = static_prefix + f"""
 Your identity: {role_text}
 Your abilities: {abilities_text or 'None'}
 Your win condition: {win_text or 'Complete team objectives'}
 Team goal: {team_goal}
 Role hint: {role_hint or 'None'}
 
+Please reply briefly (1-2 sentences) in English, keep it conversational and aligned with your identity and motivation. You can choose to continue the conversation or end it if there's no more information.
+Respond only in JSON format, no additional explanations:
+{{"content": "your reply", "end": false}}
+If you want to end the conversation, set end to true and provide a closing statement.
+"""
+    user = f"""
+You are {npc_name}, currently conversing with {partner_name} in a Goose Duck game.
+
 Task progress:
 {tasks_text}
 
@@ -36,9 +48,5 @@ Your memories (recent events):
 
 Current conversation history:
 {history_text}
-
-Please reply briefly (1-2 sentences) in English, keep it conversational and aligned with your identity and motivation. You can choose to continue the conversation or end it if there's no more information.
-Respond only in JSON format, no additional explanations:
-{{"content": "your reply", "end": false}}
-If you want to end the conversation, set end to true and provide a closing statement.
 """
+    return system, user
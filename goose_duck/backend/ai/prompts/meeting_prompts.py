@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Tuple
 
 
 def build_meeting_prompt(
@@ -13,18 +13,22 @@ def build_meeting_prompt(
     win_text: str,
     memories: str,
     messages: str,
-) -> str:
-    """Construct prompt for NPC meeting speech."""
-    return f"""
-You are {npc_name}, you are playing a Goose Duck game and currently in a discussion meeting.
+    static_prefix: str = "",
+) -> Tuple[str, str]:
+    """Construct the (system, user) prompt for NPC meeting speech."""
+    system = static_prefix + f"""
 [Your Identity] {role_info}
 [Your Abilities] {abilities}
 [Your Win Condition] {win_text or 'Complete team objectives'}
 [Team Goal] {goal}
+
+Please give a brief speech, combining your memories and the meeting content to achieve your team's goals, while maintaining the reasonableness of your identity. Output the speech content directly, no JSON.
+"""
+    user = f"""
+You are {npc_name}, you are playing a Goose Duck game and currently in a discussion meeting.
 [Your Current Memories (only you can see)]
 {memories}
 [Current Meeting Discussion Record]
 {messages if messages else '(No speeches yet)'}
-
-Please give a brief speech, combining your memories and the meeting content to achieve your team's goals, while maintaining the reasonableness of your identity. Output the speech content directly, no JSON.
 """
+    return system, user
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 
 def build_vote_prompt(
@@ -12,19 +12,24 @@ def build_vote_prompt(
     abilities: str,
     win_text: str,
     messages: List[Dict[str, Any]],
-) -> str:
+    static_prefix: str = "",
+) -> Tuple[str, str]:
+    """Construct the (system, user) prompt for an NPC vote."""
     history = "\n".join(
         f"- {m.get('speaker_name')}: {m.get('content')}"
         for m in messages[-10:]
     ) or "No speeches"
-    return f"""
-You are {npc_name}, currently in the voting phase.
+    system = static_prefix + f"""
 [Your Identity] {role_info}
 [Your Abilities] {abilities}
 [Your Win Condition] {win_text or 'Complete team objectives'}
 [Team Goal] {goal}
-[Meeting Speech Summary]
-{history}
 
 Please choose the most suspicious person from the meeting participants to vote for (or choose to skip vote). Only output the candidate's name or "skip", without other explanations.
 """
+    user = f"""
+You are {npc_name}, currently in the voting phase.
+[Meeting Speech Summary]
+{history}
+"""
+    return system, user
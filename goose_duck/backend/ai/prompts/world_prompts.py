@@ -0,0 +1,36 @@
+"""Prompt builder for the static world description shared by all NPC prompts."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+
+def build_static_prefix(map_config: Dict[str, Any], roles_config: Dict[str, Any]) -> str:
+    """Construct the rules/map/role-book prefix that never changes during a game.
+
+    Kept byte-identical across calls so providers with prompt caching can reuse it.
+    """
+    rooms = map_config.get("rooms", {}) or {}
+    room_lines = []
+    for room_id, data in rooms.items():
+        connections = ", ".join(data.get("connections", [])) or "None"
+        tasks = ", ".join(data.get("tasks", [])) or "None"
+        flags = " [Meeting room]" if data.get("is_meeting_room") else ""
+        room_lines.append(
+            f"- {data.get('name', room_id)} ({room_id}){flags}: connects to {connections}; tasks: {tasks}"
+        )
+    role_lines = [
+        f"- {data.get('name', role_id)} ({data.get('team', 'unknown')}): {data.get('description', '').strip()}"
+        for role_id, data in (roles_config.get("roles", {}) or {}).items()
+    ]
+    map_text = "\n".join(room_lines) or "(No map information)"
+    roles_text = "\n".join(role_lines) or "(No role information)"
+    return f"""
+[Game Rules]
+- Goose Duck is a social deduction game. Good players (geese) complete tasks and find the ducks; evil players (ducks) kill in secret; neutral players follow their own win condition.
+- Finding a body or pressing the emergency button starts a meeting. Everyone speaks in turn, then votes; the most voted player is ejected and ties eject no one.
+[Map]
+{map_text}
+[Role Book]
+{roles_text}
+"""
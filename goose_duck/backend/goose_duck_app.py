@@ -2,15 +2,75 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
-
+import logging
+import os
+import queue
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 
-from .goose_duck_game import GooseDuckGame
+from .ai.llm_client import close_http_client
+from .goose_duck_game import GooseDuckGame, load_token_encoder
+
+
+def _start_game_logging() -> Tuple[QueueListener, QueueHandler]:
+    """Route game debug logs through a queue so the event loop never blocks on stderr.
+
+    Level comes from LOG_LEVEL (default DEBUG, matching the old unconditional prints).
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("[%(levelname)s]%(message)s"))
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+
+    queue_handler = QueueHandler(log_queue)
+    game_logger = logging.getLogger(GooseDuckGame.__module__)
+    game_logger.setLevel(os.getenv("LOG_LEVEL", "DEBUG").upper())
+    game_logger.addHandler(queue_handler)
+    game_logger.propagate = False
+    return listener, queue_handler
+
+
+def _stop_game_logging(listener: QueueListener, queue_handler: QueueHandler) -> None:
+    """Flush pending records and hand the game logger back to normal propagation"""
+    listener.stop()
+    game_logger = logging.getLogger(GooseDuckGame.__module__)
+    game_logger.removeHandler(queue_handler)
+    game_logger.setLevel(logging.NOTSET)
+    game_logger.propagate = True
+
 
-app = FastAPI(title="LLM Goose Duck Game")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Server startup/shutdown: game logging and one-time loads run only while the app is served"""
+    listener, queue_handler = _start_game_logging()
+    load_token_encoder()
+    try:
+        yield
+    finally:
+        await close_http_client()
+        _stop_game_logging(listener, queue_handler)
+
+
+class GameJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also accepts non-string dict keys (enums serialize natively).
+
+    State endpoints return it directly so FastAPI skips jsonable_encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Snapshots are many small nested dicts; orjson serializes them far faster than json
+app = FastAPI(title="LLM Goose Duck Game", default_response_class=GameJSONResponse, lifespan=lifespan)
 
 # CORS
 app.add_middleware(
@@ -54,10 +114,10 @@ class ChatStartRequest(BaseModel):
 # ============================================================
 
 @app.get("/api/state")
-async def get_state() -> Dict[str, Any]:
+async def get_state() -> Response:
     """Get game state"""
     g = get_game()
-    return g.get_game_snapshot()
+    return Response(g.get_game_snapshot(as_json=True), media_type="application/json")
 
 
 @app.post("/api/start")
@@ -78,17 +138,17 @@ async def do_action(request: ActionRequest) -> Dict[str, Any]:
 
 
 @app.get("/api/map")
-async def get_map() -> Dict[str, Any]:
+async def get_map() -> Response:
     """Get map information"""
     g = get_game()
-    return g.get_map_info()
+    return Response(g.get_map_info(as_json=True), media_type="application/json")
 
 
 @app.get("/api/discussion")
-async def get_discussion() -> Dict[str, Any]:
+async def get_discussion() -> GameJSONResponse:
     """Get discussion state"""
     g = get_game()
-    return g.get_discussion_state()
+    return GameJSONResponse(g.get_discussion_state())
 
 
 @app.post("/api/discussion/message")
@@ -114,10 +174,10 @@ async def chat_start(request: ChatStartRequest) -> Dict[str, Any]:
 
 
 @app.get("/api/chat/state")
-async def chat_state() -> Dict[str, Any]:
+async def chat_state() -> GameJSONResponse:
     """Get current conversation state"""
     g = get_game()
-    return g.get_chat_state()
+    return GameJSONResponse(g.get_chat_state())
 
 
 @app.post("/api/chat/message")
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import logging
 import random
-import re
-import json
+import sys
+import orjson
 import yaml
+from collections import Counter, OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None  # type: ignore
 
 from .models.identity import Role, RoleType, Team, PlayerIdentity
 from .models.event import GameEvent, EventType
@@ -18,6 +29,79 @@ from .ai.prompts.action_prompts import build_decision_prompt
 from .ai.prompts.meeting_prompts import build_meeting_prompt
 from .ai.prompts.vote_prompts import build_vote_prompt
 from .ai.prompts.chat_prompts import build_chat_prompt
+from .ai.prompts.world_prompts import build_static_prefix
+
+logger = logging.getLogger(__name__)
+
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def _load_yaml_cached(path: str) -> Dict:
+    """Parse a YAML file once per process; callers treat the result as read-only"""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+# Token budgets for the variable context (memory pack plus chat/discussion history) of each prompt.
+# Action prompts carry only the k-capped memory pack, which stays far below any useful budget.
+_PROMPT_TOKEN_BUDGETS = {"meeting": 1200, "chat": 800}
+_token_encoder: Any = None
+
+
+def load_token_encoder() -> None:
+    """Load the tiktoken encoder once at server startup.
+
+    The first load may download the BPE file, so it must not happen on the request path.
+    Any failure (tiktoken missing, offline host) keeps the character estimate.
+    """
+    global _token_encoder
+    if tiktoken is None or _token_encoder is not None:
+        return
+    try:
+        _token_encoder = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("tiktoken encoder unavailable, estimating token counts: %s", e)
+        return
+    _count_tokens.cache_clear()  # Drop estimates cached before the encoder was available
+
+
+@lru_cache(maxsize=4096)
+def _count_tokens(text: str) -> int:
+    """Token count via the tiktoken encoder once loaded, otherwise a ~4 chars/token estimate"""
+    if _token_encoder is None:
+        return len(text) // 4 + 1
+    return len(_token_encoder.encode(text))
+
+
+def _trim_to_budget(segments: List[Sequence[str]], budget: int) -> List[Sequence[str]]:
+    """Drop oldest entries, always from the largest segment, until all segments fit in budget tokens.
+
+    Segments that need no trimming are returned as the same objects.
+    """
+    counts = [[_count_tokens(text) for text in segment] for segment in segments]
+    totals = [sum(c) for c in counts]
+    total = sum(totals)
+    starts = [0] * len(segments)
+    while total > budget:
+        i = max(range(len(segments)), key=totals.__getitem__)
+        dropped = counts[i][starts[i]]
+        starts[i] += 1
+        totals[i] -= dropped
+        total -= dropped
+    return [segment[start:] if start else segment for segment, start in zip(segments, starts)]
+
+
+# Player-independent action entries; shared, so callers must treat them as read-only
+_EMERGENCY_ACTION = {"type": "emergency", "target": None, "label": "🚨 Call Emergency Meeting"}
+_SKIP_VOTE_ACTION = {"type": "vote", "target": "skip", "label": "Skip vote"}
+
+# Per-prompt task line formats for _get_tasks_text
+_TASK_LINE_FORMATS = {
+    "action": "- {task} @ {room} : {progress}/2",
+    "chat": "- {task}@{room} {progress}/2",
+}
 
 
 class GamePhase(str, Enum):
@@ -29,7 +113,7 @@ class GamePhase(str, Enum):
     GAME_OVER = "game_over"   # Game over
 
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     """Room"""
     id: str
@@ -40,8 +124,12 @@ class Room:
     is_meeting_room: bool = False
     is_dangerous: bool = False
     position: Optional[Tuple[int, int]] = None  # (x, y) for map rendering
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
+        # Rooms are static after _init_rooms, which fills this cache
+        if self._dict_cache is not None:
+            return self._dict_cache
         return {
             "id": self.id,
             "name": self.name,
@@ -54,7 +142,7 @@ class Room:
         }
 
 
-@dataclass 
+@dataclass(slots=True)
 class Player:
     """Player/NPC State"""
     id: str
@@ -65,7 +153,7 @@ class Player:
     personality: str = ""
     avatar: str = "👤"
     last_action: str = "idle"
-    memories: List[str] = field(default_factory=list)
+    memories: Deque[str] = field(default_factory=lambda: deque(maxlen=20))  # Rolling, oldest dropped
     has_acted: bool = False
     last_prompt: Optional[str] = None  # Most recent action/meeting/vote/chat prompt
     last_response: Optional[str] = None
@@ -81,38 +169,46 @@ class Player:
         "meeting": None,
         "vote": None,
     })
-    tasks_progress: Dict[str, int] = field(default_factory=dict)
+    tasks_progress: bytearray = field(default_factory=bytearray)  # Indexed by game task id
     
     # Game state
-    tasks_completed: List[str] = field(default_factory=list)
+    tasks_completed_count: int = 0
     tasks_assigned: List[str] = field(default_factory=list)
     emergency_meetings_left: int = 1
     
     # Memories (for NPCs)
     observations: List[str] = field(default_factory=list)
     
+    # Serialized fields that never change after creation
+    _static_dict: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._static_dict = {
+            "id": self.id,
+            "name": self.name,
+            "is_human": self.is_human,
+            "avatar": self.avatar,
+            "tasks_total": len(self.tasks_assigned),
+        }
+    
     @property
     def is_alive(self) -> bool:
         return self.identity.is_alive if self.identity else True
     
     def to_dict(self, reveal_role: bool = False) -> Dict[str, Any]:
         result = {
-            "id": self.id,
-            "name": self.name,
-            "is_human": self.is_human,
+            **self._static_dict,
             "location": self.location,
-            "avatar": self.avatar,
             "is_alive": self.is_alive,
             "last_action": self.last_action,
-            "tasks_completed": len(self.tasks_completed),
-            "tasks_total": len(self.tasks_assigned),
+            "tasks_completed": self.tasks_completed_count,
         }
         if self.identity and reveal_role:
             result["role"] = self.identity.role.to_dict()
         return result
 
 
-@dataclass 
+@dataclass(slots=True)
 class GameState:
     """Game State"""
     phase: GamePhase = GamePhase.LOBBY
@@ -147,56 +243,156 @@ class GooseDuckGame:
         self.roles_config = self._load_yaml("roles.yaml")
         self.game_config = self._load_yaml("config.yaml")
         
+        # Single RNG for role/turn shuffles; seed via game.seed for reproducible games
+        self._rng = random.Random(self.game_config.get("game", {}).get("seed"))
+        
         # Initialize rooms
         self.rooms: Dict[str, Room] = {}
         self.task_locations: Dict[str, str] = {}
+        self._all_tasks: List[str] = []
         self._init_rooms()
         
+        # Role pool of the default setup, shuffled per game by _assign_roles
+        self._role_template: List[RoleType] = [
+            RoleType(role_config["role"])
+            for role_config in self.roles_config.get("default_setup", {}).get("roles", [])
+            for _ in range(role_config["count"])
+        ]
+        
+        # Per-role prompt text; roles_config does not change at runtime
+        self._win_text_cache: Dict[str, str] = {}
+        self._role_hint_cache: Dict[str, str] = {}
+        
+        # Rules/map/role book shared verbatim by every NPC prompt (cacheable prefix)
+        self._static_prompt_prefix = build_static_prefix(self.map_config, self.roles_config)
+        
         # Player list
         self.players: Dict[str, Player] = {}
         self.player_order: List[str] = []  # Speaking order
+        # room_id -> player ids in player order (insertion-ordered dict used as an ordered set)
+        self.players_by_room: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._player_rank: Dict[str, int] = {}  # player id -> position in player_order
         
         # Game state
         self.state = GameState()
+        self._current_time_label = "round_0"  # Event time label, refreshed when round_number changes
+        
+        # Live head counts, kept in sync at every death site
+        self._alive_count = 0
+        self._dead_count = 0
+        self._good_alive = 0
+        self._evil_alive = 0
         
         # Event log
         self.events: List[GameEvent] = []
+        # Visible event tail per location (None = unlocated), as (sequence, event);
+        # maxlen matches the 50-event visibility window of _visible_logged_events
+        self._recent_events_by_room: Dict[Optional[str], Deque[Tuple[int, GameEvent]]] = (
+            defaultdict(lambda: deque(maxlen=50))
+        )
+        # id(event) -> serialized dict for events in a visible tail or _corpse_event_cache
+        self._event_dict_cache: Dict[int, Dict[str, Any]] = {}
+        # id(event) -> victim player id for death events, recorded where they are created
+        self._event_victims: Dict[int, str] = {}
+        # (player_id, round) -> body-discovery event for a corpse, registered in _event_victims
+        self._corpse_event_cache: Dict[Tuple[str, int], GameEvent] = {}
+        
+        # Bumped by every mutator; snapshots are memoized per version
+        self.state_version: int = 0
+        self._snapshot_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._snapshot_json_cache: Dict[Tuple[str, int], bytes] = {}
+        # get_map_info result for the version it was built at
+        self._map_info_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._map_info_json: Optional[Tuple[int, bytes]] = None
+        # room_id -> occupants as seen in NPC observations, valid for the current version
+        self._people_here_cache: Dict[str, List[Dict[str, Any]]] = {}
+        
+        # (player_id, memory version hash) -> memories selected for prompts
+        self._memory_pack_cache: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        # Joined prompt sections per player, reused until their inputs change
+        self._memory_text_cache: Dict[str, Tuple[Tuple[str, ...], str]] = {}
+        self._tasks_text_cache: Dict[Tuple[str, str], Tuple[bytes, str]] = {}
         
         # LLM
         self.llm_client = get_llm_client()
+        # Exact-match response reuse within a phase: blake2b(prompt) -> response
+        self._llm_response_cache: Dict[str, str] = {}
+        self._llm_cache_hits = 0
+        self._llm_cache_misses = 0
+        # LRU of observation digest -> (prompt, response, decision); keys encode all decision inputs and the round
+        self._decision_cache: "OrderedDict[bytes, Tuple[str, str, Dict[str, Any]]]" = OrderedDict()
+        self._decision_cache_size = 512
         self._debug("Game initialized")
     
     def _load_yaml(self, filename: str) -> Dict:
         """Load YAML configuration"""
         path = self.settings_dir / filename
         if path.exists():
-            with open(path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return _load_yaml_cached(str(path))
         return {}
     
     def _init_rooms(self) -> None:
         """Initialize rooms"""
         rooms_data = self.map_config.get("rooms", {})
+        # Room ids and task names are hot dict keys; interning lets lookups hit the identity fast path
         for room_id, data in rooms_data.items():
-            self.rooms[room_id] = Room(
+            room_id = sys.intern(room_id)
+            room = self.rooms[room_id] = Room(
                 id=room_id,
                 name=data.get("name", room_id),
                 description=data.get("description", ""),
-                connections=data.get("connections", []),
-                tasks=data.get("tasks", []),
+                connections=[sys.intern(c) for c in data.get("connections", [])],
+                tasks=[sys.intern(t) for t in data.get("tasks", [])],
                 is_meeting_room=data.get("is_meeting_room", False),
                 is_dangerous=data.get("is_dangerous", False),
-                position=tuple(data.get("position", [])) if data.get("position") else None,
+                position=tuple(position) if (position := data.get("position")) else None,
             )
-            for task in data.get("tasks", []):
+            room._dict_cache = room.to_dict()
+            for task in room.tasks:
                 self.task_locations[task] = room_id
+                self._all_tasks.append(task)
+        # Shared, immutable task list handed to every player; list position is the task id
+        self._all_tasks_tuple: Tuple[str, ...] = tuple(self._all_tasks)
+        self._task_ids: Dict[str, int] = {task: tid for tid, task in enumerate(self._all_tasks_tuple)}
+        self._task_room_names: Tuple[str, ...] = tuple(
+            self.rooms[self.task_locations[task]].name or "Unknown" for task in self._all_tasks_tuple
+        )
+        # Move actions depend only on the room graph; callers treat them as read-only
+        self._move_actions_by_room: Dict[str, List[Dict[str, Any]]] = {
+            room_id: [
+                {
+                    "type": "move",
+                    "target": conn_id,
+                    "label": f"Go to {self.rooms[conn_id].name}",
+                }
+                for conn_id in room.connections
+                if conn_id in self.rooms
+            ]
+            for room_id, room in self.rooms.items()
+        }
+        # Task actions per room as (task id, (not started, in progress)) templates
+        self._task_actions_by_room: Dict[str, List[Tuple[int, Tuple[Dict[str, Any], Dict[str, Any]]]]] = {
+            room_id: [
+                (
+                    self._task_ids[task],
+                    tuple(
+                        {"type": "task", "target": task, "label": f"🛠️ {task} - {label_progress}"}
+                        for label_progress in ("Not started", "In progress (1/2)")
+                    ),
+                )
+                for task in room.tasks
+            ]
+            for room_id, room in self.rooms.items()
+        }
     
     def _init_players(self) -> None:
         """Initialize players"""
         spawn_room = self.map_config.get("spawn_room", "cafeteria")
-        all_tasks = []
-        for room in self.map_config.get("rooms", {}).values():
-            all_tasks.extend(room.get("tasks", []))
+        all_tasks = self._all_tasks_tuple
+        # start_game may run on an existing instance without reset(); rebuild the roster and room index
+        self.players = {}
+        self.player_order = []
+        self.players_by_room = defaultdict(dict)
         
         # Human player
         player_config = self.game_config.get("player", {})
@@ -207,30 +403,32 @@ class GooseDuckGame:
             location=spawn_room,
             avatar="🎮",
             tasks_assigned=list(all_tasks),
-            tasks_progress={t: 0 for t in all_tasks},
+            tasks_progress=bytearray(len(all_tasks)),
         )
         self.players["player"] = human_player
         self.player_order.append("player")
+        self.players_by_room[spawn_room]["player"] = None
         
         # NPCs
         for npc_data in self.game_config.get("npcs", []):
             npc = Player(
-                id=npc_data["id"],
+                id=sys.intern(npc_data["id"]),
                 name=npc_data["name"],
                 is_human=False,
                 location=spawn_room,
                 personality=npc_data.get("personality", ""),
                 avatar=npc_data.get("avatar", "👤"),
                 tasks_assigned=list(all_tasks),
-                tasks_progress={t: 0 for t in all_tasks},
+                tasks_progress=bytearray(len(all_tasks)),
             )
             self.players[npc.id] = npc
             self.player_order.append(npc.id)
+            self.players_by_room[spawn_room][npc.id] = None
+        self._player_rank = {pid: rank for rank, pid in enumerate(self.player_order)}
         
         # Randomize turn order, player goes first
-        import random
         self.turn_order = list(self.player_order)
-        random.shuffle(self.turn_order)
+        self._rng.shuffle(self.turn_order)
         if "player" in self.turn_order:
             self.turn_order.remove("player")
             self.turn_order.insert(0, "player")
@@ -238,50 +436,63 @@ class GooseDuckGame:
     
     def _assign_roles(self) -> None:
         """Assign roles"""
-        setup = self.roles_config.get("default_setup", {})
-        role_list: List[RoleType] = []
-        
-        for role_config in setup.get("roles", []):
-            role_type = RoleType(role_config["role"])
-            count = role_config["count"]
-            role_list.extend([role_type] * count)
+        # Shuffle a copy of the static role pool
+        role_list = self._role_template.copy()
+        self._rng.shuffle(role_list)
         
-        # Shuffle roles
-        random.shuffle(role_list)
+        # Assign to players (extra players beyond the role list stay without identity)
+        self._good_alive = self._evil_alive = 0
+        for player, role_type in zip(self.players.values(), role_list):
+            role = Role.from_type(role_type)
+            player.identity = PlayerIdentity(
+                player_id=player.id,
+                player_name=player.name,
+                role=role,
+            )
+            if role.team == Team.GOOD:
+                self._good_alive += 1
+            elif role.team == Team.EVIL:
+                self._evil_alive += 1
         
-        # Assign to players
-        player_ids = list(self.players.keys())
-        for i, player_id in enumerate(player_ids):
-            if i < len(role_list):
-                role = Role.from_type(role_list[i])
-                self.players[player_id].identity = PlayerIdentity(
-                    player_id=player_id,
-                    player_name=self.players[player_id].name,
-                    role=role,
-                )
+        self._alive_count = len(self.players)
+        self._dead_count = 0
     
     def start_game(self) -> Dict[str, Any]:
         """Start game"""
+        self._bump_version()
+        # Nothing cached from a previous game on this instance may carry over
+        self._llm_response_cache.clear()
+        self._decision_cache.clear()
+        self._corpse_event_cache.clear()
+        self._event_dict_cache.clear()
+        self._event_victims.clear()
         self._init_players()
         self._assign_roles()
         
         self.state.phase = GamePhase.FREE_ROAM
         self.state.round_number = 1
+        self._current_time_label = "round_1"
         self._reset_turn_flags()
         self._debug("Game started -> FREE_ROAM")
         
         # Add start event
-        self.events.append(GameEvent(
-            event_type=EventType.SYSTEM,
-            text="Game started! Find the ducks hidden among the crew!",
-            day=1,
-            time="round_1",
-        ))
+        self._event(EventType.SYSTEM, "Game started! Find the ducks hidden among the crew!")
         
         return self.get_game_snapshot()
     
-    def get_game_snapshot(self, player_id: str = "player") -> Dict[str, Any]:
-        """Get game state snapshot"""
+    def get_game_snapshot(self, player_id: str = "player", as_json: bool = False) -> Union[Dict[str, Any], bytes]:
+        """Get game state snapshot; as_json returns the orjson-encoded bytes, also cached per version"""
+        if as_json:
+            json_key = (player_id, self.state_version)
+            data = self._snapshot_json_cache.get(json_key)
+            if data is None:
+                data = self._snapshot_json_cache[json_key] = orjson.dumps(self.get_game_snapshot(player_id))
+            return data
+        cache_key = (player_id, self.state_version)
+        cached = self._snapshot_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         player = self.players.get(player_id)
         if not player:
             return {"error": "Player does not exist"}
@@ -289,10 +500,13 @@ class GooseDuckGame:
         # Current room
         current_room = self.rooms.get(player.location)
         
+        # Each player is serialized once and shared by players_here and all_players
+        player_dicts = {pid: p.to_dict() for pid, p in self.players.items()}
+        
         # People in the same room
         players_here = [
-            p.to_dict() for p in self.players.values()
-            if p.location == player.location and p.id != player_id and p.is_alive
+            player_dicts[pid] for pid in self.players_by_room[player.location]
+            if pid != player_id and self.players[pid].is_alive
         ]
         
         # Available actions
@@ -304,10 +518,13 @@ class GooseDuckGame:
             my_role = player.identity.role.to_dict()
         
         # Event visibility: only see current location or unlocated events
-        visible_events = self._get_visible_events(player.id, player.location)
-        known_deaths = self._extract_known_deaths(visible_events)
+        logged = self._visible_logged_events(player.location)
+        corpses = self._corpse_events(player.location)
+        known_deaths = self._extract_known_deaths(logged + corpses)
+        recent_events = [self._event_to_dict(e) for e in logged[-10:]]
+        recent_events.extend(self._event_to_dict(e) for e in corpses)
 
-        return {
+        snapshot = {
             "phase": self.state.phase.value,
             "round": self.state.round_number,
             "player": {
@@ -320,10 +537,10 @@ class GooseDuckGame:
                 "tasks": [
                     {
                         "name": t,
-                        "progress": player.tasks_progress.get(t, 0),
+                        "progress": player.tasks_progress[self._task_ids[t]],
                         "required": 2,
-                        "location": (room_id := self.task_locations.get(t)),
-                        "location_name": self.rooms[room_id].name if room_id in self.rooms else None,
+                        "location": (room_id := self.task_locations[t]),
+                        "location_name": self.rooms[room_id].name,
                     }
                     for t in player.tasks_assigned
                 ],
@@ -331,16 +548,15 @@ class GooseDuckGame:
             "current_room": current_room.to_dict() if current_room else None,
             "players_here": players_here,
             "available_actions": actions,
-            "events": [e.to_dict() for e in visible_events[-10:]],
-            "all_players": [
-                p.to_dict(reveal_role=False) 
-                for p in self.players.values()
-            ],
+            "events": recent_events[-10:],
+            "all_players": list(player_dicts.values()),
             "known_deaths": known_deaths,
             "conversation_active": self.state.conversation_active,
-            "alive_count": sum(1 for p in self.players.values() if p.is_alive),
-            "dead_count": sum(1 for p in self.players.values() if not p.is_alive),
+            "alive_count": self._alive_count,
+            "dead_count": self._dead_count,
         }
+        self._snapshot_cache[cache_key] = snapshot
+        return snapshot
     
     def _get_available_actions(self, player_id: str) -> List[Dict[str, Any]]:
         """Get player available actions"""
@@ -353,45 +569,32 @@ class GooseDuckGame:
         
         if self.state.phase == GamePhase.FREE_ROAM:
             # Move actions
-            if current_room:
-                for conn_id in current_room.connections:
-                    conn_room = self.rooms.get(conn_id)
-                    if conn_room:
-                        actions.append({
-                            "type": "move",
-                            "target": conn_id,
-                            "label": f"Go to {conn_room.name}",
-                        })
+            actions.extend(self._move_actions_by_room.get(player.location, ()))
             
             # Interact with people in same room
-            for other in self.players.values():
-                if other.id != player_id and other.location == player.location and other.is_alive:
-                    actions.append({
-                        "type": "talk",
-                        "target": other.id,
-                        "label": f"Talk with {other.name}",
-                    })
-                    
-                    # Kill (if duck and cooldown complete)
-                    if player.identity and player.identity.can_use_kill():
-                        actions.append({
-                            "type": "kill",
-                            "target": other.id,
-                            "label": f"🔪 Kill {other.name}",
-                        })
+            others = [
+                other for other_id in self.players_by_room[player.location]
+                if other_id != player_id and (other := self.players[other_id]).is_alive
+            ]
+            actions.extend(
+                {"type": "talk", "target": other.id, "label": f"Talk with {other.name}"}
+                for other in others
+            )
+            # Kill (if duck and cooldown complete)
+            if player.identity and player.identity.can_use_kill():
+                actions.extend(
+                    {"type": "kill", "target": other.id, "label": f"🔪 Kill {other.name}"}
+                    for other in others
+                )
             
             # Emergency meeting (if in meeting room)
             if current_room and current_room.is_meeting_room:
                 if player.emergency_meetings_left > 0:
-                    actions.append({
-                        "type": "emergency",
-                        "target": None,
-                        "label": "🚨 Call Emergency Meeting",
-                    })
+                    actions.append(_EMERGENCY_ACTION)
             
             # Report body (if room has body)
-            dead_here = [p for p in self.players.values() 
-                        if p.location == player.location and not p.is_alive]
+            dead_here = [p for pid in self.players_by_room[player.location]
+                        if not (p := self.players[pid]).is_alive]
             if dead_here:
                 actions.append({
                     "type": "report",
@@ -400,16 +603,10 @@ class GooseDuckGame:
                 })
             
             # Do tasks
-            if current_room:
-                for task in current_room.tasks:
-                    progress = player.tasks_progress.get(task, 0)
-                    if progress < 2:
-                        label_progress = "Not started" if progress == 0 else "In progress (1/2)"
-                        actions.append({
-                            "type": "task",
-                            "target": task,
-                            "label": f"🛠️ {task} - {label_progress}",
-                        })
+            progress = player.tasks_progress
+            for tid, templates in self._task_actions_by_room.get(player.location, ()):
+                if progress[tid] < 2:
+                    actions.append(templates[progress[tid]])
         
         elif self.state.phase == GamePhase.VOTING:
             # Voting
@@ -420,11 +617,7 @@ class GooseDuckGame:
                         "target": other.id,
                         "label": f"Vote for {other.name}",
                     })
-            actions.append({
-                "type": "vote",
-                "target": "skip",
-                "label": "Skip vote",
-            })
+            actions.append(_SKIP_VOTE_ACTION)
         
         return actions
     
@@ -472,7 +665,7 @@ class GooseDuckGame:
     
     async def _do_move(self, player_id: str, room_id: str) -> Dict[str, Any]:
         """Move to another room"""
-        player = self.players.get(player_id)
+        player = self.players[player_id]
         current_room = self.rooms.get(player.location)
         target_room = self.rooms.get(room_id)
         
@@ -482,25 +675,24 @@ class GooseDuckGame:
         if room_id not in current_room.connections:
             return {"error": "Cannot reach this room"}
         
+        self._bump_version()
         old_location = player.location
-        player.location = room_id
+        self._move_player(player, room_id)
         player.last_action = f"Moved to {target_room.name}"
         
-        # Leave old room event (only visible in old room)
-        self.events.append(GameEvent(
-            event_type=EventType.PLAYER_ACTION,
-            text=f"{player.name} left the room",
-            day=self.state.round_number,
-            time=f"round_{self.state.round_number}",
-            location=old_location,
-        ))
-        self.events.append(GameEvent(
-            event_type=EventType.PLAYER_ACTION,
-            text=f"{player.name} moved to {target_room.name}",
-            day=self.state.round_number,
-            time=f"round_{self.state.round_number}",
-            location=room_id,
-        ))
+        # Leave old room event (only visible in old room), then arrival in new room
+        self._push_events(
+            self._new_event(
+                EventType.PLAYER_ACTION,
+                f"{player.name} left the room",
+                location=old_location,
+            ),
+            self._new_event(
+                EventType.PLAYER_ACTION,
+                f"{player.name} moved to {target_room.name}",
+                location=room_id,
+            ),
+        )
         self._record_memory_for_room(room_id, f"{player.name} arrived at {target_room.name}")
         self._debug(f"{player.name} moved {old_location}->{room_id}")
         
@@ -521,30 +713,28 @@ class GooseDuckGame:
         if killer.location != victim.location:
             return {"error": "Target is not in the same room"}
         
+        self._bump_version()
         if victim.identity.is_protected:
             # Protected by doctor
             victim.identity.is_protected = False
-            self.events.append(GameEvent(
-                event_type=EventType.SYSTEM,
-                text=f"Someone tried to attack {victim.name}, but they were protected!",
-                day=self.state.round_number,
-                time=f"round_{self.state.round_number}",
-            ))
+            self._event(
+                EventType.SYSTEM,
+                f"Someone tried to attack {victim.name}, but they were protected!",
+            )
         else:
             # Kill successful
-            victim.identity.is_alive = False
+            self._mark_dead(victim)
             killer.identity.use_kill()
             trigger_canadian_report = False
             killer.last_action = f"Killed {victim.name}"
             victim.last_action = f"Killed by {killer.name}"
             
-            self.events.append(GameEvent(
-                event_type=EventType.CRIME,
-                text=f"💀 {victim.name} was found dead in {self.rooms[victim.location].name}!",
-                day=self.state.round_number,
-                time=f"round_{self.state.round_number}",
+            kill_events = [self._new_event(
+                EventType.CRIME,
+                f"💀 {victim.name} was found dead in {self.rooms[victim.location].name}!",
                 location=victim.location,
-            ))
+            )]
+            self._event_victims[id(kill_events[0])] = victim.id
             self._record_memory_for_room(victim.location, f"{victim.name} was killed by {killer.name}")
 
             # Sheriff killing a goose causes mutual destruction
@@ -552,14 +742,13 @@ class GooseDuckGame:
                 killer.identity.role.role_type == RoleType.SHERIFF
                 and victim.identity.role.team == Team.GOOD
             ):
-                killer.identity.is_alive = False
-                self.events.append(GameEvent(
-                    event_type=EventType.CRITICAL,
-                    text=f"⚖️ {killer.name} mistakenly killed a goose and died together with {victim.name}!",
-                    day=self.state.round_number,
-                    time=f"round_{self.state.round_number}",
+                self._mark_dead(killer)
+                kill_events.append(self._new_event(
+                    EventType.CRITICAL,
+                    f"⚖️ {killer.name} mistakenly killed a goose and died together with {victim.name}!",
                     location=victim.location,
                 ))
+            self._push_events(*kill_events)
 
             # Canadian goose forces report when killed (ignore 1 second delay)
             if (
@@ -592,10 +781,11 @@ class GooseDuckGame:
     
     async def _do_emergency(self, caller_id: str) -> Dict[str, Any]:
         """Call emergency meeting"""
-        player = self.players.get(caller_id)
+        player = self.players[caller_id]
         if player.emergency_meetings_left <= 0:
             return {"error": "No emergency meetings left"}
         
+        self._bump_version()
         player.emergency_meetings_left -= 1
         player.last_action = "Called emergency meeting"
         return await self._start_discussion(caller_id, is_emergency=True)
@@ -607,13 +797,15 @@ class GooseDuckGame:
         body_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Start discussion phase"""
+        self._bump_version()
+        self._llm_response_cache.clear()
         self.state.phase = GamePhase.DISCUSSION
         self.state.reporter = reporter_id
         self.state.discussion_messages = []
         self.state.votes = {}
         self.state.current_speaker_index = 0
         # Speaking order: reporter first, then cycle through turn order
-        alive_ids = [pid for pid in self.turn_order if (p := self.players.get(pid)) and p.is_alive]
+        alive_ids = [pid for pid in self.turn_order if self.players[pid].is_alive]
         if reporter_id in alive_ids:
             start = alive_ids.index(reporter_id)
             self.state.speaker_order = alive_ids[start:] + alive_ids[:start]
@@ -624,29 +816,24 @@ class GooseDuckGame:
         reporter = self.players.get(reporter_id)
         
         if is_emergency:
-            self.events.append(GameEvent(
-                event_type=EventType.CRITICAL,
-                text=f"🚨 {reporter.name} called an emergency meeting!",
-                day=self.state.round_number,
-                time=f"round_{self.state.round_number}",
-            ))
+            self._event(EventType.CRITICAL, f"🚨 {reporter.name} called an emergency meeting!")
             self._record_memory_for_all(f"{reporter.name} called an emergency meeting")
         else:
             body = self.players.get(body_id)
             self.state.body_location = body.location if body else None
-            self.events.append(GameEvent(
-                event_type=EventType.CRITICAL,
-                text=f"☠️ {reporter.name} found {body.name}'s body!",
-                day=self.state.round_number,
-                time=f"round_{self.state.round_number}",
-            ))
+            report_event = self._new_event(
+                EventType.CRITICAL,
+                f"☠️ {reporter.name} found {body.name}'s body!",
+            )
+            self._event_victims[id(report_event)] = body.id
+            self._push_event(report_event)
             self._record_memory_for_all(f"{reporter.name} reported {body.name}'s body")
         
         # Teleport everyone to meeting room
         meeting_room = self.map_config.get("emergency_button_room", "cafeteria")
         for player in self.players.values():
             if player.is_alive:
-                player.location = meeting_room
+                self._move_player(player, meeting_room)
 
         # Let current speaker (if NPC) speak first until player's turn or end
         await self.advance_discussion()
@@ -657,34 +844,24 @@ class GooseDuckGame:
         if self.state.phase != GamePhase.VOTING:
             return {"error": "Not currently in voting phase"}
         
+        self._bump_version()
         self.state.votes[voter_id] = target_id if target_id != "skip" else None
         
         voter = self.players.get(voter_id)
         if target_id and target_id != "skip":
             target = self.players.get(target_id)
-            self.events.append(GameEvent(
-                event_type=EventType.SYSTEM,
-                text=f"{voter.name} voted for {target.name}",
-                day=self.state.round_number,
-                time=f"round_{self.state.round_number}",
-            ))
+            self._event(EventType.SYSTEM, f"{voter.name} voted for {target.name}")
             voter.last_action = f"Voted for {target.name}"
             self._record_memory_for_all(f"{voter.name} voted for {target.name}")
             self._debug(f"{voter.name} voted for {target.name}")
         else:
-            self.events.append(GameEvent(
-                event_type=EventType.SYSTEM,
-                text=f"{voter.name} chose to skip vote",
-                day=self.state.round_number,
-                time=f"round_{self.state.round_number}",
-            ))
+            self._event(EventType.SYSTEM, f"{voter.name} chose to skip vote")
             voter.last_action = "Skipped vote"
             self._record_memory_for_all(f"{voter.name} chose to skip vote")
             self._debug(f"{voter.name} skipped vote")
         
         # Check if everyone has voted
-        alive_players = [p for p in self.players.values() if p.is_alive]
-        if len(self.state.votes) >= len(alive_players):
+        if len(self.state.votes) >= self._alive_count:
             await self._resolve_votes()
             self._debug("All votes collected, resolving")
         
@@ -692,47 +869,32 @@ class GooseDuckGame:
     
     async def _resolve_votes(self) -> None:
         """Resolve votes"""
+        self._bump_version()
         # Count votes
-        vote_counts: Dict[str, int] = {}
-        for target_id in self.state.votes.values():
-            if target_id:
-                vote_counts[target_id] = vote_counts.get(target_id, 0) + 1
+        vote_counts = Counter(v for v in self.state.votes.values() if v)
         
         if not vote_counts:
             # All skipped
-            self.events.append(GameEvent(
-                event_type=EventType.SYSTEM,
-                text="Voting result: No one was ejected",
-                day=self.state.round_number,
-                time=f"round_{self.state.round_number}",
-            ))
+            self._event(EventType.SYSTEM, "Voting result: No one was ejected")
         else:
             # Find highest votes
-            max_votes = max(vote_counts.values())
-            top_voted = [pid for pid, cnt in vote_counts.items() if cnt == max_votes]
+            top_voted = vote_counts.most_common(2)
             
-            if len(top_voted) > 1:
+            if len(top_voted) > 1 and top_voted[0][1] == top_voted[1][1]:
                 # Tie
-                self.events.append(GameEvent(
-                    event_type=EventType.SYSTEM,
-                    text="Voting result: Tie, no one was ejected",
-                    day=self.state.round_number,
-                    time=f"round_{self.state.round_number}",
-                ))
+                self._event(EventType.SYSTEM, "Voting result: Tie, no one was ejected")
             else:
                 # Eject
-                ejected_id = top_voted[0]
+                ejected_id = top_voted[0][0]
                 ejected = self.players.get(ejected_id)
-                ejected.identity.is_alive = False
+                self._mark_dead(ejected)
                 
                 # Show identity
                 role_name = ejected.identity.role.name
-                self.events.append(GameEvent(
-                    event_type=EventType.CRITICAL,
-                    text=f"🗳️ {ejected.name} was ejected! Their identity is: {role_name}",
-                    day=self.state.round_number,
-                    time=f"round_{self.state.round_number}",
-                ))
+                self._event(
+                    EventType.CRITICAL,
+                    f"🗳️ {ejected.name} was ejected! Their identity is: {role_name}",
+                )
                 
                 # Check dodo victory
                 if ejected.identity.role.role_type == RoleType.DODO:
@@ -746,18 +908,16 @@ class GooseDuckGame:
         
         if self.state.phase != GamePhase.GAME_OVER:
             # Return to free roam
+            self._llm_response_cache.clear()
             self.state.phase = GamePhase.FREE_ROAM
             self.state.round_number += 1
+            self._current_time_label = sys.intern(f"round_{self.state.round_number}")
             self._reset_turn_flags()
     
     def _check_win_condition(self) -> None:
         """Check win condition"""
-        alive_players = [p for p in self.players.values() if p.is_alive]
-        
-        good_alive = sum(1 for p in alive_players 
-                        if p.identity and p.identity.role.team == Team.GOOD)
-        evil_alive = sum(1 for p in alive_players 
-                        if p.identity and p.identity.role.team == Team.EVIL)
+        good_alive = self._good_alive
+        evil_alive = self._evil_alive
         
         # Evil victory: evil count >= good count
         if evil_alive >= good_alive and evil_alive > 0:
@@ -773,45 +933,145 @@ class GooseDuckGame:
             self.state.phase = GamePhase.GAME_OVER
             return
     
-    async def _npc_actions(self) -> None:
-        """Deprecated"""
-        return
+    def _move_player(self, player: Player, room_id: str) -> None:
+        """Change a player's location, keeping players_by_room in sync and in player order"""
+        self.players_by_room[player.location].pop(player.id, None)
+        player.location = room_id
+        occupants = self.players_by_room[room_id]
+        occupants[player.id] = None
+        if len(occupants) > 1:
+            # Readers iterate rooms directly, so keep them independent of arrival order
+            self.players_by_room[room_id] = dict.fromkeys(sorted(occupants, key=self._player_rank.__getitem__))
+
+    def _mark_dead(self, player: Player) -> None:
+        """Mark player dead and update live head counts (no-op if already dead)"""
+        if not player.is_alive:
+            return
+        player.identity.is_alive = False
+        self._alive_count -= 1
+        self._dead_count += 1
+        team = player.identity.role.team if player.identity else None
+        if team == Team.GOOD:
+            self._good_alive -= 1
+        elif team == Team.EVIL:
+            self._evil_alive -= 1
 
     async def _decide_npc_action(self, npc: Player) -> Dict[str, Any]:
-        """Call LLM to decide NPC action"""
-        
-        obs = self._build_observation(npc)
-        prompt = self._build_decision_prompt(npc, obs)
-        response = await self.llm_client.complete(prompt, max_tokens=256)
+        """Call LLM to decide NPC action (to be applied right away, so its prompt is recorded)"""
+        prompt, response, action = (await self._decide_npc_actions([npc]))[0]
+        self._record_action_prompt(npc, prompt, response)
+        return action
+
+    async def _decide_npc_actions(self, npcs: List[Player]) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Decide several NPC actions with one batched LLM request, returns (prompt, response, action).
+
+        Nothing is recorded on the NPCs; callers record a decision when they apply it.
+        """
+        observations = [self._build_observation(npc) for npc in npcs]
+        keys = [self._decision_key(npc, obs) for npc, obs in zip(npcs, observations)]
+        results: List[Optional[Tuple[str, str, Dict[str, Any]]]] = []
+        for key in keys:
+            cached = self._decision_cache.get(key)
+            if cached is not None:
+                self._decision_cache.move_to_end(key)
+            results.append(cached)
+        missing = [i for i, cached in enumerate(results) if cached is None]
+        if not missing:
+            return results
+
+        prompts = [self._build_decision_prompt(npcs[i], observations[i]) for i in missing]
+        responses = await self._complete_many(prompts, max_tokens=256)
+        for i, (system, user), response in zip(missing, prompts, responses):
+            prompt = system + user
+            action = self._parse_decision_response(response, observations[i])
+            results[i] = self._decision_cache[keys[i]] = (prompt, response, action)
+            if len(self._decision_cache) > self._decision_cache_size:
+                self._decision_cache.popitem(last=False)
+        return results
+
+    @staticmethod
+    def _record_action_prompt(npc: Player, prompt: str, response: str) -> None:
+        """Expose the action prompt/response behind an NPC's latest decision (admin overview)"""
         npc.last_prompt = prompt
         npc.last_response = response
         npc.last_prompts["action"] = prompt
         npc.last_responses["action"] = response
-        action = self._parse_decision_response(response, obs)
-        return action
- 
+
+    def _decision_key(self, npc: Player, obs: Dict[str, Any]) -> bytes:
+        """Digest of every observation field a decision depends on, plus the NPC, role and round.
+
+        The round keeps an unchanged observation (e.g. an NPC alone in a room) from replaying
+        an old decision forever; each round samples the LLM afresh.
+        """
+        room = obs.get("room")
+        role = obs.get("role")
+        canonical = {
+            # The prompt is written for this NPC (name, personality), so decisions are never shared
+            "npc": npc.id,
+            "phase": obs["phase"],
+            "round": obs["round"],
+            "room_id": room.id if room else None,
+            "connections": obs["connections"],
+            "people_here": obs["people_here"],
+            "available_actions": obs["available_actions"],
+            "memories": obs["memories"],
+            "tasks_progress": list(obs["tasks_progress"]),
+            "role": role.role_type if role else None,
+        }
+        return hashlib.blake2b(
+            orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS, default=str), digest_size=16
+        ).digest()
+
+    async def _complete(self, prompt: Tuple[str, str], **params: Any) -> str:
+        """Call the LLM with a (system, user) prompt, reusing the response for a byte-identical prompt in the same phase"""
+        return (await self._complete_many([prompt], **params))[0]
+
+    async def _complete_many(
+        self, prompts: List[Tuple[str, str]], return_exceptions: bool = False, **params: Any
+    ) -> List[Any]:
+        """Batched _complete: cached prompts are answered locally, the rest go out in one batch.
+
+        With return_exceptions a failed request yields its exception in that slot (and is not cached).
+        """
+        keys = [
+            hashlib.blake2b(
+                f"{sorted(params.items())}\x1f{system}\x1f{user}".encode("utf-8"), digest_size=16
+            ).hexdigest()
+            for system, user in prompts
+        ]
+        responses: List[Optional[str]] = [self._llm_response_cache.get(key) for key in keys]
+        missing = [i for i, response in enumerate(responses) if response is None]
+        hits = len(prompts) - len(missing)
+        self._llm_cache_hits += hits
+        self._llm_cache_misses += len(missing)
+        if hits:
+            total = self._llm_cache_hits + self._llm_cache_misses
+            self._debug(f"LLM cache hit ({self._llm_cache_hits}/{total})")
+        if missing:
+            # The role-only system message goes first so providers can cache it across NPCs
+            fresh = await self.llm_client.batch_complete(
+                [prompts[i][1] for i in missing],
+                systems=[prompts[i][0] for i in missing],
+                return_exceptions=return_exceptions,
+                **params,
+            )
+            for i, response in zip(missing, fresh):
+                responses[i] = response
+                if not isinstance(response, BaseException):
+                    self._llm_response_cache[keys[i]] = response
+        return responses
 
     def _build_observation(self, npc: Player) -> Dict[str, Any]:
         current_room = self.rooms.get(npc.location)
         connections = current_room.connections if current_room else []
-        people_here = [
-            {"id": p.id, "name": p.name, "is_alive": p.is_alive}
-            for p in self.players.values()
-            if p.location == npc.location
-        ]
+        # Room-level fields are shared by every observation in the room until the next mutation
+        people_here = self._people_here_cache.get(npc.location)
+        if people_here is None:
+            people_here = self._people_here_cache[npc.location] = [
+                {"id": p.id, "name": p.name, "is_alive": p.is_alive}
+                for p in map(self.players.__getitem__, self.players_by_room.get(npc.location, ()))
+            ]
         available = self._get_available_actions(npc.id)
-        tasks_info = []
-        for task, prog in npc.tasks_progress.items():
-            room_id = self.task_locations.get(task)
-            room_name = self.rooms.get(room_id).name if room_id in self.rooms else room_id
-            tasks_info.append(
-                {
-                    "name": task,
-                    "progress": prog,
-                    "room_id": room_id,
-                    "room_name": room_name,
-                }
-            )
         return {
             "phase": self.state.phase.value,
             "round": self.state.round_number,
@@ -819,55 +1079,64 @@ class GooseDuckGame:
             "connections": connections,
             "people_here": people_here,
             "available_actions": available,
-            "memories": npc.memories[-8:],
+            "valid_action_types": frozenset(a["type"] for a in available),
+            "memories": self._get_memory_pack(npc, npc.location),
             "role": npc.identity.role if npc.identity else None,
             "tasks_progress": npc.tasks_progress,
-            "tasks_info": tasks_info,
         }
 
-    def _build_decision_prompt(self, npc: Player, obs: Dict[str, Any]) -> str:
+    def _build_decision_prompt(self, npc: Player, obs: Dict[str, Any]) -> Tuple[str, str]:
         role = obs["role"]
-        role_hint = ""
-        if role:
-            role_hint = self.roles_config.get("roles", {}).get(role.role_type.value, {}).get("prompt_hint", "").strip()
+        role_hint = self._get_role_hint(role)
         win_text = self._get_role_win_text(role)
-        return build_decision_prompt(npc.name, obs, role_hint, win_text)
+        # Text sections are built here rather than in the observation, so decision-cache hits skip them
+        return build_decision_prompt(
+            npc.name, obs, role_hint, win_text,
+            memory_text=self._get_memory_text(npc, obs["memories"]),
+            tasks_text=self._get_tasks_text(npc, "action"),
+            static_prefix=self._static_prompt_prefix,
+        )
 
     def _parse_decision_response(self, text: str, obs: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            import json
-            data = json.loads(text.strip())
+            data = orjson.loads(text.strip())
             action = data.get("action", "wait")
             target = data.get("target")
         except Exception:
             return {"action": "wait", "target": None}
 
-        valid_actions = {a["type"]: a for a in obs["available_actions"]}
-        if action not in valid_actions:
+        if action == "wait" or action not in obs["valid_action_types"]:
             return {"action": "wait", "target": None}
         if action == "move" and target not in obs["connections"]:
             return {"action": "wait", "target": None}
-        if action in ("kill", "vote") and target and target not in [p["id"] for p in obs["people_here"]]:
+        if action in ("kill", "vote") and target and not any(p["id"] == target for p in obs["people_here"]):
             return {"action": "wait", "target": None}
         return {"action": action, "target": target}
 
-    def _build_meeting_prompt(self, npc: Player) -> str:
+    def _build_meeting_prompt(self, npc: Player) -> Tuple[str, str]:
         role = npc.identity.role if npc.identity else None
-        role_info = f"{role.name} (Team: {role.team.value})" if role else "Unknown"
+        role_info = f"{role.name} (Team: {role.team})" if role else "Unknown"
         team_goals = {
             "good": "Complete tasks or eliminate evil players.",
             "evil": "Hide identity and make evil count exceed good count.",
             "neutral": "Meet your special win condition.",
         }
-        goal = team_goals.get(role.team.value, "") if role else ""
+        goal = team_goals.get(role.team, "") if role else ""
         abilities = ", ".join(role.abilities) if role and role.abilities else "None"
         win_text = self._get_role_win_text(role)
-        memories = "\n".join(npc.memories[-8:]) if npc.memories else "None"
-        msg_history = "\n".join(
-            f"- {m.get('speaker_name')}: {m.get('content')}"
-            for m in self.state.discussion_messages[-10:]
+        pack, messages = _trim_to_budget(
+            [
+                self._get_memory_pack(npc, self.state.body_location),
+                [f"- {m.get('speaker_name')}: {m.get('content')}" for m in self.state.discussion_messages[-10:]],
+            ],
+            _PROMPT_TOKEN_BUDGETS["meeting"],
+        )
+        memories = self._get_memory_text(npc, pack) or "None"
+        msg_history = "\n".join(messages)
+        return build_meeting_prompt(
+            npc.name, role_info, goal, abilities, win_text, memories, msg_history,
+            static_prefix=self._static_prompt_prefix,
         )
-        return build_meeting_prompt(npc.name, role_info, goal, abilities, win_text, memories, msg_history)
 
     async def _apply_npc_decision(self, npc: Player, decision: Dict[str, Any]) -> None:
         action = decision.get("action")
@@ -888,6 +1157,7 @@ class GooseDuckGame:
             await self._do_talk(npc.id, target, auto=True)
         else:
             npc.last_action = "Waiting"
+            self._bump_version()
 
     async def _process_turns(self) -> None:
         """Let NPCs act in order, one action per round"""
@@ -901,7 +1171,7 @@ class GooseDuckGame:
                 return
             pending = [
                 pid for pid in self.turn_order
-                if (p := self.players.get(pid)) and p.is_alive and not p.has_acted
+                if (p := self.players[pid]).is_alive and not p.has_acted
             ]
             if not pending:
                 if self.state.phase != GamePhase.FREE_ROAM:
@@ -914,22 +1184,67 @@ class GooseDuckGame:
             for _ in range(length):
                 self.turn_index = (self.turn_index + 1) % length
                 candidate_id = self.turn_order[self.turn_index]
-                cand = self.players.get(candidate_id)
-                if cand and cand.is_alive and not cand.has_acted:
+                cand = self.players[candidate_id]
+                if cand.is_alive and not cand.has_acted:
                     next_id = candidate_id
                     break
             else:
                 return
-            next_player = self.players.get(next_id)
+            next_player = self.players[next_id]
             if next_player.is_human:
                 return  # Wait for player action
-            # NPC action
-            decision = await self._decide_npc_action(next_player)
-            await self._apply_npc_decision(next_player, decision)
+            # NPCs in distinct rooms decide in one batch, then act in turn order
+            batch = self._collect_npc_batch(self.turn_index)
+            batch_version = self.state_version
+            views = [self._room_view(npc) for _, npc in batch]
+            results = await self._decide_npc_actions([npc for _, npc in batch])
+            for (index, npc), view, (prompt, response, decision) in zip(batch, views, results):
+                if (
+                    self.state.phase != GamePhase.FREE_ROAM
+                    or self.state.conversation_active
+                    or not npc.is_alive
+                    or npc.has_acted
+                ):
+                    break  # State moved on; the rest decide again next loop
+                if self.state_version != batch_version and (
+                    # Earlier NPCs changed the world: someone entered/left/died here, or the choice is now invalid
+                    self._room_view(npc) != view
+                    or self._parse_decision_response(response, self._build_observation(npc)) != decision
+                ):
+                    decision = await self._decide_npc_action(npc)
+                else:
+                    self._record_action_prompt(npc, prompt, response)
+                self.turn_index = index
+                await self._apply_npc_decision(npc, decision)
             # Loop continues until next unacted human or all have acted
 
+    def _room_view(self, npc: Player) -> Tuple[str, Tuple[Tuple[str, bool], ...]]:
+        """What an NPC sees of its room: location plus who is there and whether they are alive"""
+        return npc.location, tuple(
+            (pid, self.players[pid].is_alive) for pid in self.players_by_room[npc.location]
+        )
+
+    def _collect_npc_batch(self, start_index: int) -> List[Tuple[int, Player]]:
+        """Consecutive unacted NPCs from start_index, one per room, stopping at the next human"""
+        batch: List[Tuple[int, Player]] = []
+        rooms: Set[str] = set()
+        length = len(self.turn_order)
+        for offset in range(length):
+            index = (start_index + offset) % length
+            p = self.players[self.turn_order[index]]
+            if not p.is_alive or p.has_acted:
+                continue
+            if p.is_human or p.location in rooms:
+                break
+            batch.append((index, p))
+            rooms.add(p.location)
+        return batch
+
     def _start_new_round(self) -> None:
+        self._bump_version()
+        self._llm_response_cache.clear()
         self.state.round_number += 1
+        self._current_time_label = sys.intern(f"round_{self.state.round_number}")
         self.turn_index = 0
         self._reset_turn_flags()
         self._debug(f"Start new round {self.state.round_number}")
@@ -937,6 +1252,55 @@ class GooseDuckGame:
     def _reset_turn_flags(self) -> None:
         for p in self.players.values():
             p.has_acted = False
+
+    def _new_event(self, event_type: EventType, text: str, location: Optional[str] = None) -> GameEvent:
+        """Create an event stamped with the current round and its cached time label"""
+        return GameEvent(
+            event_type=event_type,
+            text=text,
+            day=self.state.round_number,
+            time=self._current_time_label,
+            location=location,
+        )
+
+    def _event(self, event_type: EventType, text: str, location: Optional[str] = None) -> GameEvent:
+        """Create a current-round event and append it to the log"""
+        event = self._new_event(event_type, text, location)
+        self._push_event(event)
+        return event
+
+    def _push_event(self, event: GameEvent) -> None:
+        """Append to the event log and the per-location snapshot tail"""
+        self._index_event(len(self.events), event)
+        self.events.append(event)
+
+    def _push_events(self, *events: GameEvent) -> None:
+        """Append several events with a single log extend"""
+        seq = len(self.events)
+        for offset, event in enumerate(events):
+            self._index_event(seq + offset, event)
+        self.events.extend(events)
+
+    def _index_event(self, seq: int, event: GameEvent) -> None:
+        tail = self._recent_events_by_room[event.location]
+        if len(tail) == tail.maxlen:
+            self._event_dict_cache.pop(id(tail[0][1]), None)
+        tail.append((seq, event))
+
+    def _event_to_dict(self, event: GameEvent) -> Dict[str, Any]:
+        """Serialize an event once; logged and cached corpse events are never mutated after creation"""
+        key = id(event)
+        cached = self._event_dict_cache.get(key)
+        if cached is None:
+            cached = self._event_dict_cache[key] = event.to_dict()
+        return cached
+
+    def _bump_version(self) -> None:
+        """Mark game state as changed, invalidating memoized snapshots"""
+        self.state_version += 1
+        self._snapshot_cache.clear()
+        self._snapshot_json_cache.clear()
+        self._people_here_cache.clear()
     
     def get_discussion_state(self) -> Dict[str, Any]:
         """Get discussion state"""
@@ -948,7 +1312,7 @@ class GooseDuckGame:
             "reporter": self.state.reporter,
             "messages": self.state.discussion_messages,
             "current_speaker": current_id,
-            "votes": {k: v for k, v in self.state.votes.items()},
+            "votes": self.state.votes,  # Serialized by the caller, never mutated there
         }
     
     async def add_discussion_message(
@@ -972,20 +1336,26 @@ class GooseDuckGame:
     
     def start_voting(self) -> Dict[str, Any]:
         """Start voting"""
+        self._bump_version()
+        self._llm_response_cache.clear()
         self.state.phase = GamePhase.VOTING
         self.state.votes = {}
         self._debug("Enter VOTING phase")
-        self.events.append(GameEvent(
-            event_type=EventType.SYSTEM,
-            text="Discussion ended, voting begins!",
-            day=self.state.round_number,
-            time=f"round_{self.state.round_number}",
-        ))
+        self._event(EventType.SYSTEM, "Discussion ended, voting begins!")
         
         return self.get_game_snapshot()
     
-    def get_map_info(self) -> Dict[str, Any]:
-        """Get map information"""
+    def get_map_info(self, as_json: bool = False) -> Union[Dict[str, Any], bytes]:
+        """Get map information, rebuilt only after a state change; as_json returns orjson-encoded bytes"""
+        if as_json:
+            if self._map_info_json is None or self._map_info_json[0] != self.state_version:
+                self._map_info_json = (
+                    self.state_version,
+                    orjson.dumps(self.get_map_info()),
+                )
+            return self._map_info_json[1]
+        if self._map_info_cache is not None and self._map_info_cache[0] == self.state_version:
+            return self._map_info_cache[1]
         rooms_info = {}
         for room_id, room in self.rooms.items():
             players_here = [
@@ -996,63 +1366,141 @@ class GooseDuckGame:
                     "is_alive": p.is_alive,
                     "last_action": p.last_action,
                 }
-                for p in self.players.values()
-                if p.location == room_id
+                for p in map(self.players.__getitem__, self.players_by_room.get(room_id, ()))
             ]
             rooms_info[room_id] = {
                 **room.to_dict(),
                 "players": players_here,
             }
         
-        return {
+        map_info = {
             "rooms": rooms_info,
             "spawn_room": self.map_config.get("spawn_room"),
             "meeting_room": self.map_config.get("emergency_button_room"),
         }
+        self._map_info_cache = (self.state_version, map_info)
+        return map_info
     
     def reset(self) -> Dict[str, Any]:
         """Reset game"""
+        self._bump_version()
         self.players = {}
         self.player_order = []
+        self.players_by_room = defaultdict(dict)
+        self._player_rank = {}
         self.state = GameState()
+        self._current_time_label = "round_0"
+        self._alive_count = self._dead_count = 0
+        self._good_alive = self._evil_alive = 0
         self.events = []
+        self._recent_events_by_room.clear()
+        self._event_dict_cache.clear()
+        self._event_victims.clear()
+        self._corpse_event_cache.clear()
+        self._memory_pack_cache.clear()
+        self._memory_text_cache.clear()
+        self._tasks_text_cache.clear()
+        self._llm_response_cache.clear()
+        self._decision_cache.clear()
         self.turn_order: List[str] = []
         self.turn_index: int = 0
         return {"message": "Game has been reset"}
 
     def _record_memory_for_room(self, room_id: str, text: str) -> None:
         """Record event in memories of players in the same room"""
-        for p in self.players.values():
-            if p.location == room_id:
-                p.memories.append(text)
-                if len(p.memories) > 20:
-                    p.memories = p.memories[-20:]
+        for pid in self.players_by_room.get(room_id, ()):
+            self.players[pid].memories.append(text)
 
     def _record_memory_for_all(self, text: str) -> None:
         """Record in all players' memories (public events like meetings, votes)"""
         for p in self.players.values():
             p.memories.append(text)
-            if len(p.memories) > 20:
-                p.memories = p.memories[-20:]
-
-    def _get_visible_events(self, player_id: str, location: Optional[str]) -> List[GameEvent]:
-        """Filter events by player perspective: current room or unlocated events, and add body discovery info"""
-        events = [
-            e for e in self.events[-50:]
-            if e.location is None or e.location == location
-        ]
-        if location:
-            corpses_here = [
-                p for p in self.players.values() if not p.is_alive and p.location == location
-            ]
-            for corpse in corpses_here:
-                events.append(GameEvent(
-                    event_type=EventType.CRIME,
-                    text=f"☠️ Body found: {corpse.name}",
-                    day=self.state.round_number,
-                    time=f"round_{self.state.round_number}",
+
+    def _get_memory_pack(self, player: Player, location: Optional[str] = None, k: int = 8) -> Tuple[str, ...]:
+        """Select at most k memories for a prompt: mentions of location first, then most recent.
+
+        Output keeps chronological order, so identical memories always yield an identical pack.
+        """
+        memories = tuple(player.memories)  # deque indexing is O(n) away from the ends
+        version_hash = hashlib.blake2b(
+            "\x1f".join((*memories, location or "", str(k))).encode("utf-8"), digest_size=8
+        ).hexdigest()
+        key = (player.id, version_hash)
+        pack = self._memory_pack_cache.get(key)
+        if pack is not None:
+            return pack
+        if len(memories) <= k:
+            pack = tuple(memories)
+        else:
+            room = self.rooms.get(location) if location else None
+            marker = room.name if room else None
+            ranked = sorted(
+                range(len(memories)),
+                key=lambda i: (marker is not None and marker in memories[i], i),
+                reverse=True,
+            )
+            pack = tuple(memories[i] for i in sorted(ranked[:k]))
+        if len(self._memory_pack_cache) >= 256:
+            self._memory_pack_cache.clear()
+        self._memory_pack_cache[key] = pack
+        return pack
+
+    def _get_memory_text(self, player: Player, pack: Tuple[str, ...]) -> str:
+        """Newline-joined memory pack, reused while the player's pack is unchanged"""
+        cached = self._memory_text_cache.get(player.id)
+        if cached is not None and cached[0] is pack:
+            return cached[1]
+        text = "\n".join(pack)
+        self._memory_text_cache[player.id] = (pack, text)
+        return text
+
+    def _get_tasks_text(self, player: Player, style: str) -> str:
+        """Task progress lines in the given _TASK_LINE_FORMATS style, reused until progress changes"""
+        progress = bytes(player.tasks_progress)
+        key = (player.id, style)
+        cached = self._tasks_text_cache.get(key)
+        if cached is not None and cached[0] == progress:
+            return cached[1]
+        line = _TASK_LINE_FORMATS[style]
+        text = "\n".join(
+            line.format(task=task, room=room_name, progress=prog)
+            for task, room_name, prog in zip(self._all_tasks_tuple, self._task_room_names, progress)
+        )
+        self._tasks_text_cache[key] = (progress, text)
+        return text
+
+    def _visible_logged_events(self, location: Optional[str]) -> List[GameEvent]:
+        """Logged events among the last 50 that are unlocated or at location, from the per-location tails"""
+        floor = len(self.events) - 50
+        if location is None:
+            tail = self._recent_events_by_room[None]
+        else:
+            tail = heapq.merge(
+                self._recent_events_by_room[None],
+                self._recent_events_by_room[location],
+                key=itemgetter(0),
+            )
+        return [e for seq, e in tail if seq >= floor]
+
+    def _corpse_events(self, location: Optional[str]) -> List[GameEvent]:
+        """Transient body-discovery events for corpses lying at location"""
+        if not location:
+            return []
+        events = []
+        for pid in self.players_by_room.get(location, ()):
+            corpse = self.players[pid]
+            if corpse.is_alive:
+                continue
+            key = (pid, self.state.round_number)
+            event = self._corpse_event_cache.get(key)
+            if event is None:
+                event = self._corpse_event_cache[key] = self._new_event(
+                    EventType.CRIME,
+                    f"☠️ Body found: {corpse.name}",
                     location=location,
-                ))
+                )
+                self._event_victims[id(event)] = pid
+            events.append(event)
         return events
 
     def _extract_known_deaths(self, events: List[GameEvent]) -> List[Dict[str, Any]]:
@@ -1061,55 +1509,58 @@ class GooseDuckGame:
         for ev in events:
             if ev.event_type not in (EventType.CRIME, EventType.CRITICAL):
                 continue
-            text = ev.text or ""
-            name = None
-            if "found" in text and "body" in text.lower():
-                # e.g., "A found B's body"
-                try:
-                    part = text.split("found", 1)[1]
-                    name = part.split("'s body")[0].split("body:")[-1].strip(" :：!！")
-                except Exception:
-                    name = None
-            if not name and "was found dead in" in text:
-                name = text.replace("💀", "").split("was found dead in")[0].strip(" :：!！")
-            if not name and "Body found:" in text:
-                m = re.search(r"Body found:\s*([^\s!]+)", text)
-                if m:
-                    name = m.group(1)
-            if not name:
+            victim_id = self._event_victims.get(id(ev))
+            if victim_id is None or victim_id in known:
                 continue
-            if name not in known:
-                known[name] = {
-                    "name": name,
-                    "location": ev.location,
-                    "location_name": self.rooms.get(ev.location).name if ev.location in self.rooms else None,
-                    "text": text,
-                }
+            known[victim_id] = {
+                "name": self.players[victim_id].name,
+                "location": ev.location,
+                "location_name": self.rooms[ev.location].name if ev.location in self.rooms else None,
+                "text": ev.text or "",
+            }
         return list(known.values())
 
+    def _get_role_hint(self, role: Optional[Role]) -> str:
+        """Return the configured prompt hint for a role, cached per role type"""
+        if not role:
+            return ""
+        hint = self._role_hint_cache.get(role.role_type)
+        if hint is None:
+            hint = self._role_hint_cache[role.role_type] = (
+                self.roles_config.get("roles", {}).get(role.role_type, {}).get("prompt_hint", "").strip()
+            )
+        return hint
+
     def _get_role_win_text(self, role: Optional[Role]) -> str:
-        """Return win condition description based on role and config"""
+        """Return win condition description based on role and config, cached per role type"""
         if not role:
             return ""
+        text = self._win_text_cache.get(role.role_type)
+        if text is None:
+            text = self._win_text_cache[role.role_type] = self._build_role_win_text(role)
+        return text
+
+    def _build_role_win_text(self, role: Role) -> str:
         win_cfg = self.roles_config.get("win_conditions", {})
         # Role-specific priority (e.g., dodo)
         if role.role_type == RoleType.DODO:
             return win_cfg.get("neutral", {}).get("dodo", "Win by being voted out in voting phase.")
-        team_key = role.team.value if role.team else None
+        team_key = role.team if role.team else None
         team_rules = win_cfg.get(team_key) if win_cfg else None
         if isinstance(team_rules, list):
             return "; ".join(team_rules)
         if isinstance(team_rules, str):
             return team_rules
         # fallback
-        if role.team.value == "good":
+        if role.team == "good":
             return "Complete all tasks or eliminate all evil players."
-        if role.team.value == "evil":
+        if role.team == "evil":
             return "Evil count reaches or exceeds good count."
         return role.win_condition or "Meet your special win condition."
 
     async def _start_chat(self, initiator_id: str, target_id: str) -> None:
         """Initialize conversation context"""
+        self._bump_version()
         room = self.players.get(initiator_id).location if initiator_id in self.players else None
         self.state.conversation_active = True
         self.state.conversation_participants = [initiator_id, target_id]
@@ -1188,45 +1639,42 @@ class GooseDuckGame:
         if not npc or not target:
             return
         role = npc.identity.role if npc.identity else None
-        role_hint = ""
-        if role:
-            role_hint = self.roles_config.get("roles", {}).get(role.role_type.value, {}).get("prompt_hint", "").strip()
+        role_hint = self._get_role_hint(role)
         team_goals = {
             "good": "Complete tasks or eliminate evil players.",
             "evil": "Hide identity and make evil count exceed good count.",
             "neutral": "Meet your special win condition.",
         }
-        team_goal = team_goals.get(role.team.value, "") if role else ""
-        tasks_info = []
-        for task, prog in npc.tasks_progress.items():
-            room_id = self.task_locations.get(task)
-            room_name = self.rooms.get(room_id).name if room_id in self.rooms else room_id
-            tasks_info.append(f"{task}@{room_name or 'Unknown'} {prog}/2")
-        history = [
-            f"{m.get('speaker_name')}: {m.get('content')}"
-            for m in self.state.conversation_messages[-10:]
-        ]
+        team_goal = team_goals.get(role.team, "") if role else ""
+        pack, history = _trim_to_budget(
+            [
+                self._get_memory_pack(npc, self.state.conversation_room),
+                [f"{m.get('speaker_name')}: {m.get('content')}" for m in self.state.conversation_messages[-10:]],
+            ],
+            _PROMPT_TOKEN_BUDGETS["chat"],
+        )
         prompt = build_chat_prompt(
             npc_name=npc.name,
             partner_name=target.name,
-            role_text=f"{role.name} ({role.team.value})" if role else "Unknown",
+            role_text=f"{role.name} ({role.team})" if role else "Unknown",
             team_goal=team_goal,
             role_hint=role_hint,
             abilities_text=", ".join(role.abilities) if role and role.abilities else "None",
             win_text=self._get_role_win_text(role),
-            memories=npc.memories[-8:],
+            memory_text=self._get_memory_text(npc, pack),
             chat_history=history,
-            tasks_info=tasks_info,
+            tasks_text=self._get_tasks_text(npc, "chat"),
+            static_prefix=self._static_prompt_prefix,
         )
-        response = await self.llm_client.complete(prompt, max_tokens=120)
-        npc.last_prompt = prompt
+        response = await self._complete(prompt, max_tokens=120)
+        npc.last_prompt = "".join(prompt)
         npc.last_response = response
-        npc.last_prompts["chat"] = prompt
+        npc.last_prompts["chat"] = npc.last_prompt
         npc.last_responses["chat"] = response
         text = ""
         end_flag = False
         try:
-            data = json.loads(response.strip())
+            data = orjson.loads(response.strip())
             text = data.get("content") or ""
             end_flag = bool(data.get("end"))
         except Exception:
@@ -1255,21 +1703,14 @@ class GooseDuckGame:
 
     async def _finalize_chat(self, reason: str = "", resume_turns: bool = True) -> None:
         """End conversation, write to memory and optionally resume action loop"""
+        self._bump_version()
         summary = self._chat_summary_text()
         if summary:
-            self.events.append(GameEvent(
-                event_type=EventType.PLAYER_ACTION,
-                text=summary,
-                day=self.state.round_number,
-                time=f"round_{self.state.round_number}",
-                location=self.state.conversation_room,
-            ))
+            self._event(EventType.PLAYER_ACTION, summary, location=self.state.conversation_room)
             for pid in self.state.conversation_participants:
                 player = self.players.get(pid)
                 if player:
                     player.memories.append(summary)
-                    if len(player.memories) > 20:
-                        player.memories = player.memories[-20:]
         self.state.conversation_active = False
         self.state.conversation_participants = []
         self.state.conversation_messages = []
@@ -1299,23 +1740,26 @@ class GooseDuckGame:
         return None
 
     def _debug(self, msg: str) -> None:
-        """Simple debug output"""
-        print(f"[DEBUG][{self.state.phase.value}][round {self.state.round_number}] {msg}")
+        """Debug output, free when DEBUG logging is off"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s][round %d] %s", self.state.phase.value, self.state.round_number, msg)
     
     async def _do_task(self, player_id: str, task: str) -> Dict[str, Any]:
         """Execute task, requires two completions"""
-        player = self.players.get(player_id)
+        player = self.players[player_id]
         room = self.rooms.get(player.location)
         if not room or task not in room.tasks:
             return {"error": "No such task here"}
-        progress = player.tasks_progress.get(task, 0)
+        tid = self._task_ids[task]
+        progress = player.tasks_progress[tid]
         if progress >= 2:
             return {"error": "Task already completed"}
+        self._bump_version()
         progress += 1
-        player.tasks_progress[task] = progress
+        player.tasks_progress[tid] = progress
         player.last_action = f"Doing task {task} ({progress}/2)"
-        if progress >= 2 and task not in player.tasks_completed:
-            player.tasks_completed.append(task)
+        if progress >= 2:
+            player.tasks_completed_count += 1
         # Record room memory (same room only)
         self._record_memory_for_room(player.location, f"{player.name} is doing task {task} ({progress}/2)")
         return {"ok": True}
@@ -1332,6 +1776,7 @@ class GooseDuckGame:
             return {"error": "Target cannot be conversed with"}
         if speaker.location != target.location:
             return {"error": "Must be in the same room to converse"}
+        self._bump_version()
         if auto and (speaker.is_human or target.is_human):
             speaker.last_action = "Waiting"
             return {"ok": True}
@@ -1354,43 +1799,60 @@ class GooseDuckGame:
         if self.state.phase != GamePhase.DISCUSSION:
             return
 
-        # If current is NPC, auto speak until player's turn or end
-        while True:
-            if self.state.current_speaker_index >= len(self.state.speaker_order):
-                # Speaking ended, start voting
-                self.start_voting()
-                return
-
-            speaker_id = self.state.speaker_order[self.state.current_speaker_index]
-            speaker = self.players.get(speaker_id)
-            if not speaker or not speaker.is_alive:
-                self.state.current_speaker_index += 1
-                continue
-
+        # Collect consecutive NPC speakers until the player's turn or the end.
+        # speaker_order only holds players alive when the meeting started, and nobody dies mid-discussion.
+        players = self.players
+        speaker_order = self.state.speaker_order
+        index = self.state.current_speaker_index
+        speakers: List[Player] = []
+        while index < len(speaker_order):
+            speaker = players[speaker_order[index]]
             if speaker.is_human:
                 # Player's turn, wait for player input
-                return
+                break
+            speakers.append(speaker)
+            index += 1
 
-            # NPC speaks
+        # Speeches go out in one batch, so every NPC in it sees the discussion as it stood
+        # before the batch, not the speeches of the NPCs batched ahead of it.
+        # A failure only silences the speaker it belongs to.
+        if speakers:
+            prompts: Dict[int, Tuple[str, str]] = {}
+            for i, speaker in enumerate(speakers):
+                try:
+                    prompts[i] = self._build_meeting_prompt(speaker)
+                except Exception as e:
+                    self._debug(f"{speaker.name} meeting prompt failed: {e}")
+            responses: List[Optional[str]] = [None] * len(speakers)
             try:
-                prompt = self._build_meeting_prompt(speaker)
-                response = await self.llm_client.complete(prompt, max_tokens=120)
-                speaker.last_prompt = prompt
-                speaker.last_response = response
-                speaker.last_prompts["meeting"] = prompt
-                speaker.last_responses["meeting"] = response
-                self.state.discussion_messages.append({
-                    "speaker_id": speaker_id,
-                    "speaker_name": speaker.name,
-                    "content": response,
-                })
-                self._debug(f"{speaker.name} speaks")
-            except Exception:
+                results = await self._complete_many(list(prompts.values()), return_exceptions=True, max_tokens=120)
+            except Exception as e:
+                self._debug(f"Meeting speech batch failed: {e}")
+                results = []
+            for i, result in zip(prompts, results):
+                if isinstance(result, BaseException):
+                    self._debug(f"{speakers[i].name} speech failed: {result}")
+                else:
+                    responses[i] = result
+            if self.state.phase != GamePhase.DISCUSSION:
+                return
+            for i, (speaker, response) in enumerate(zip(speakers, responses)):
+                if response is None:
+                    content = "(silence)"
+                else:
+                    content = response
+                    speaker.last_prompt = "".join(prompts[i])
+                    speaker.last_response = response
+                    speaker.last_prompts["meeting"] = speaker.last_prompt
+                    speaker.last_responses["meeting"] = response
+                    self._debug(f"{speaker.name} speaks")
                 self.state.discussion_messages.append({
-                    "speaker_id": speaker_id,
+                    "speaker_id": speaker.id,
                     "speaker_name": speaker.name,
-                    "content": "(silence)",
+                    "content": content,
                 })
 
-            self.state.current_speaker_index += 1
-            # Continue while loop, may have next NPC to speak
+        self.state.current_speaker_index = index
+        if index >= len(speaker_order):
+            # Speaking ended, start voting
+            self.start_voting()
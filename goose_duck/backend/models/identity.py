@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Final, Literal, Mapping, NamedTuple, Optional, Tuple
 
 
 class Team(str, Enum):
@@ -29,102 +30,141 @@ class RoleType(str, Enum):
     ASSASSIN = "assassin"         # Assassin [Duck] - Can snipe during meetings
 
 
-# Role configurations
-ROLE_CONFIGS: Dict[RoleType, Dict[str, Any]] = {
+class _RoleSpec(NamedTuple):
+    """Static role definition"""
+    team: Team
+    name: str
+    description: str
+    abilities: Tuple[str, ...] = ()
+    can_kill: bool = False
+    kill_uses: Optional[int] = None
+    win_condition: Optional[str] = None
+
+
+# Plain-string forms stored on Role; str comparison and hashing skip the Enum machinery
+TeamName = Literal["good", "neutral", "evil"]
+RoleName = Literal["goose", "sheriff", "vigilante", "canadian", "dodo", "assassin"]
+
+
+# Role configurations (read-only; specs are immutable tuples, so callers never need to copy)
+ROLE_CONFIGS: Final[Mapping[RoleType, _RoleSpec]] = MappingProxyType({
     # Good
-    RoleType.GOOSE: {
-        "team": Team.GOOD,
-        "name": "Goose",
-        "description": "Regular good player, wins by completing tasks or finding evil players",
-        "abilities": [],
-        "can_kill": False,
-    },
-    RoleType.SHERIFF: {
-        "team": Team.GOOD,
-        "name": "Sheriff [Goose]",
-        "description": "Can kill any role, but killing a goose will cause mutual destruction.",
-        "abilities": ["sheriff_kill"],
-        "can_kill": True,
-    },
-    RoleType.VIGILANTE: {
-        "team": Team.GOOD,
-        "name": "Vigilante [Goose]",
-        "description": "Only one kill opportunity, can hunt any target.",
-        "abilities": ["single_kill"],
-        "can_kill": True,
-        "kill_uses": 1,
-    },
-    RoleType.CANADIAN: {
-        "team": Team.GOOD,
-        "name": "Canadian Goose",
-        "description": "Forces the killer to immediately report when killed.",
-        "abilities": ["death_report"],
-        "can_kill": False,
-    },
+    RoleType.GOOSE: _RoleSpec(
+        team=Team.GOOD,
+        name="Goose",
+        description="Regular good player, wins by completing tasks or finding evil players",
+        abilities=(),
+        can_kill=False,
+    ),
+    RoleType.SHERIFF: _RoleSpec(
+        team=Team.GOOD,
+        name="Sheriff [Goose]",
+        description="Can kill any role, but killing a goose will cause mutual destruction.",
+        abilities=("sheriff_kill",),
+        can_kill=True,
+    ),
+    RoleType.VIGILANTE: _RoleSpec(
+        team=Team.GOOD,
+        name="Vigilante [Goose]",
+        description="Only one kill opportunity, can hunt any target.",
+        abilities=("single_kill",),
+        can_kill=True,
+        kill_uses=1,
+    ),
+    RoleType.CANADIAN: _RoleSpec(
+        team=Team.GOOD,
+        name="Canadian Goose",
+        description="Forces the killer to immediately report when killed.",
+        abilities=("death_report",),
+        can_kill=False,
+    ),
 
     # Neutral
-    RoleType.DODO: {
-        "team": Team.NEUTRAL,
-        "name": "Dodo",
-        "description": "Wins directly by being voted out in the voting phase.",
-        "abilities": [],
-        "can_kill": False,
-        "win_condition": "voted_out",
-    },
+    RoleType.DODO: _RoleSpec(
+        team=Team.NEUTRAL,
+        name="Dodo",
+        description="Wins directly by being voted out in the voting phase.",
+        abilities=(),
+        can_kill=False,
+        win_condition="voted_out",
+    ),
     
     # Evil
-    RoleType.ASSASSIN: {
-        "team": Team.EVIL,
-        "name": "Assassin [Duck]",
-        "description": "Disguised as a goose, kills secretly; can snipe twice during meetings (once per meeting).",
-        "abilities": ["kill", "snipe"],
-        "can_kill": True,
-    },
-}
+    RoleType.ASSASSIN: _RoleSpec(
+        team=Team.EVIL,
+        name="Assassin [Duck]",
+        description="Disguised as a goose, kills secretly; can snipe twice during meetings (once per meeting).",
+        abilities=("kill", "snipe"),
+        can_kill=True,
+    ),
+})
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Role:
-    """Role Identity"""
-    role_type: RoleType
-    team: Team
+    """Role Identity (immutable; one shared instance per role type)"""
+    role_type: RoleName  # RoleType.value
+    team: TeamName  # Team.value; still compares equal to Team members
     name: str
     description: str
-    abilities: List[str] = field(default_factory=list)
+    abilities: Tuple[str, ...] = ()
     can_kill: bool = False
     kill_uses: Optional[int] = None
     win_condition: Optional[str] = None
     
     @classmethod
     def from_type(cls, role_type: RoleType) -> "Role":
-        """Create role from role type"""
-        config = ROLE_CONFIGS[role_type]
-        return cls(
-            role_type=role_type,
-            team=config["team"],
-            name=config["name"],
-            description=config["description"],
-            abilities=config.get("abilities", []),
-            can_kill=config.get("can_kill", False),
-            kill_uses=config.get("kill_uses"),
-            win_condition=config.get("win_condition"),
-        )
+        """Get the shared role for a role type (a raw value string like "goose" also works)"""
+        return _ROLE_CACHE[role_type]
     
     def to_dict(self) -> Dict[str, Any]:
+        """Shared precomputed dict for cached roles; callers must not mutate it"""
+        if _ROLE_CACHE.get(self.role_type) is self:
+            return _ROLE_DICT_CACHE[self.role_type]
+        return self._build_dict()
+
+    def _build_dict(self) -> Dict[str, Any]:
         return {
-            "role_type": self.role_type.value,
-            "team": self.team.value,
+            "role_type": self.role_type,
+            "team": self.team,
             "name": self.name,
             "description": self.description,
-            "abilities": self.abilities,
+            "abilities": list(self.abilities),
             "can_kill": self.can_kill,
             "kill_uses": self.kill_uses,
         }
 
 
-@dataclass
+def _build_role(role_type: RoleType) -> Role:
+    """Create role from its ROLE_CONFIGS entry"""
+    spec = ROLE_CONFIGS[role_type]
+    return Role(
+        role_type=role_type.value,
+        team=spec.team.value,
+        name=spec.name,
+        description=spec.description,
+        abilities=spec.abilities,
+        can_kill=spec.can_kill,
+        kill_uses=spec.kill_uses,
+        win_condition=spec.win_condition,
+    )
+
+
+# Roles carry no per-player state, so every player with the same role shares one instance
+# RoleType is a str enum, so the plain value strings stored on Role hit the same keys
+_ROLE_CACHE: Dict[RoleType, Role] = {role_type: _build_role(role_type) for role_type in ROLE_CONFIGS}
+_ROLE_DICT_CACHE: Dict[RoleType, Dict[str, Any]] = {
+    role_type: role._build_dict() for role_type, role in _ROLE_CACHE.items()
+}
+
+
+# kill_uses_remaining value for roles without a kill limit, so checks are a single compare
+_UNLIMITED = 1 << 30
+
+
+@dataclass(slots=True, eq=False, repr=False)
 class PlayerIdentity:
-    """Player Identity State"""
+    """Player Identity State (compared by identity; one instance per player)"""
     player_id: str
     player_name: str
     role: Role
@@ -138,19 +178,23 @@ class PlayerIdentity:
     def __post_init__(self) -> None:
         """Initialize remaining uses for one-time abilities"""
         if self.kill_uses_remaining is None:
-            self.kill_uses_remaining = self.role.kill_uses
+            kill_uses = self.role.kill_uses
+            self.kill_uses_remaining = _UNLIMITED if kill_uses is None else kill_uses
     
+    def __repr__(self) -> str:
+        return f"<PlayerIdentity {self.player_id} {self.role.role_type}>"
+
     def can_use_kill(self) -> bool:
         """Whether can use kill ability"""
         return (
             self.is_alive 
             and self.role.can_kill 
-            and (self.kill_uses_remaining is None or self.kill_uses_remaining > 0)
+            and self.kill_uses_remaining > 0
         )
     
     def use_kill(self) -> None:
         """Use kill ability and enter cooldown"""
-        if self.kill_uses_remaining is not None and self.kill_uses_remaining > 0:
+        if 0 < self.kill_uses_remaining < _UNLIMITED:
             self.kill_uses_remaining -= 1
     
     def to_dict(self, reveal_role: bool = False) -> Dict[str, Any]: